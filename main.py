@@ -3,30 +3,365 @@
 import warnings
 warnings.filterwarnings("ignore")
 
-from collections import namedtuple
+from dataclasses import dataclass, asdict
+import functools
+import hashlib
+import importlib.util
+import pickle
 import time
-import termios
 import sys
-import tty
-import textwrap
+import select
+import signal
 import subprocess
 import shutil
 import argparse
 import os
 import re
 import string
-import inquirer
 import termcolor
 
-try:
-  import aspell as spellchecker
-except ModuleNotFoundError:
-  spellchecker = None
+## inquirer (and its dependency tree), aspell, termios and tty are imported
+## lazily: the --config, --version and nothing-to-commit paths never need
+## them, so they should not pay the import cost
 
 VERSION='0.1.1'
 
+
+@dataclass(frozen=True, slots=True)
+class Params:
+  """
+  Immutable structure with all the configuration parameters
+
+  Declared once at module scope so readParameters does not rebuild a class
+  on every call, as the previous dynamically created namedtuple did.
+
+  """
+  UseDefaultMenu: str
+  MaxLength: int
+  WrapLength: int
+  BlankChar: str
+  ConfirmCommit: str
+  MultipleTypes: str
+  TypesStyle: str
+  Spellcheck: str
+  SpellcheckMaxOptions: int
+  SpellcheckLanguage: str
+  ScopeLength: int
+  userTypes: tuple
+  menu: tuple
+
+## Cache for the git root directory, keyed by the working directory so the
+## subprocess call runs at most once per process
+_gitRootCache = {}
+
+## Cached result of the batched read-only startup git queries, keyed by the
+## working directory: (root, somethingStaged)
+_gitStateCache = {}
+
+
+def _getGitStateInProcess(cwd):
+  """
+  Answers the startup git queries in process through pygit2
+
+  pygit2 binds libgit2, so the repository root and the staged-changes
+  check cost no fork/exec at all. The module is optional: when it is not
+  installed, or anything about the repository confuses it, None is
+  returned and the caller falls back to spawning git.
+
+  Parameters
+  ----------
+  cwd: str
+    Working directory to resolve the repository from
+
+  Returns
+  -------
+  tuple or None
+    (root, somethingStaged), or None when pygit2 cannot answer
+
+  """
+  if importlib.util.find_spec("pygit2") is None:
+    return None
+
+  try:
+    import pygit2
+
+    gitDir = pygit2.discover_repository(cwd)
+    if gitDir is None:
+      return None
+
+    repo = pygit2.Repository(gitDir)
+    if repo.workdir is None:
+      return None
+    root = repo.workdir.rstrip('/')
+
+    if repo.head_is_unborn:
+      staged = len(repo.index) > 0
+    else:
+      tree = repo.head.peel(pygit2.Tree)
+      staged = len(repo.index.diff_to_tree(tree)) > 0
+
+    return (root, staged)
+  except Exception:
+    return None
+
+
+def getGitState():
+  """
+  Runs the read-only startup git queries as one batch
+
+  When pygit2 is available both answers come from libgit2 without leaving
+  the process. Otherwise the repository root lookup and the staged-changes
+  check are independent, so both processes are spawned back to back and
+  waited on together instead of sequentially; either way the result is
+  cached for the rest of the run.
+
+  Returns
+  -------
+  tuple
+    Repository root path and a bool telling whether something is staged
+
+  """
+  cwd = os.getcwd()
+  if cwd not in _gitStateCache:
+    state = _getGitStateInProcess(cwd)
+    if state is not None:
+      _gitStateCache[cwd] = state
+      _gitRootCache.setdefault(cwd, state[0])
+      return state
+
+    rootProcess = subprocess.Popen(['git', 'rev-parse', '--show-toplevel'],
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL)
+    ## diff-index is the plumbing behind git diff --cached; calling it
+    ## directly skips the porcelain setup and the worktree refresh
+    diffProcess = subprocess.Popen(['git', 'diff-index', '--cached',
+                                    '--quiet', 'HEAD'],
+                                   stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)
+
+    root = rootProcess.communicate()[0].decode('utf-8').rstrip('\n')
+    diffStatus = diffProcess.wait()
+
+    if diffStatus > 1:
+      ## HEAD does not exist yet (fresh repository with no commits): fall
+      ## back to the porcelain, which diffs the index against the empty tree
+      diffStatus = subprocess.run(['git', 'diff', '--cached', '--quiet'],
+                                  stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL).returncode
+
+    staged = diffStatus == 1
+
+    if rootProcess.returncode != 0:
+      raise subprocess.CalledProcessError(rootProcess.returncode,
+                                          rootProcess.args)
+
+    _gitStateCache[cwd] = (root, staged)
+    _gitRootCache.setdefault(cwd, root)
+
+  return _gitStateCache[cwd]
+
+
+def _clearGitCaches():
+  """
+  Drops every cache derived from the repository state
+
+  Only needed when the process outlives a repository change, e.g. tests
+  that switch between temporary repositories.
+
+  Returns
+  -------
+  None
+
+  """
+  _gitRootCache.clear()
+  _gitStateCache.clear()
+  getParametersFilename.cache_clear()
+  readParameters.cache_clear()
+
+## Lazily imported inquirer module, loaded on first use
+_inquirerModule = None
+
+
+def _inquirer():
+  """
+  Returns the inquirer module, importing it on first use
+
+  inquirer pulls in a sizeable dependency tree (readchar, blessed), so the
+  import is deferred until a menu is actually shown.
+
+  Returns
+  -------
+  module
+    The imported inquirer module
+
+  """
+  global _inquirerModule
+  if _inquirerModule is None:
+    import inquirer
+    _inquirerModule = inquirer
+  return _inquirerModule
+
+
+def _hasSpellchecker():
+  """
+  Check whether the aspell module is available without importing it
+
+  Returns
+  -------
+  bool
+    True if the aspell module can be imported, False otherwise
+
+  """
+  return importlib.util.find_spec("aspell") is not None
+
+## Formatters for the commit-type prefix keyed by the TypesStyle
+## parameter; resolved once per run instead of branching on every
+## edit-loop iteration
+_TYPES_FORMATTERS = {
+  'comma': ','.join,
+  'brackets': lambda types: ''.join('[' + commitType + ']'
+                                    for commitType in types),
+}
+
+## Map from the SpellcheckLanguage parameter to aspell language codes
+_LANG_CODES = {
+  'english': 'en',
+  'spanish': 'es',
+  'deutch': 'de',
+  'french': 'fr',
+  'portuguese': 'pt'
+}
+
+## Cache of aspell speller instances keyed by language code. Building a
+## speller loads its whole dictionary from disk, so one instance is shared
+## by every spellcheck call of the process
+_spellerCache = {}
+
+## Tokenizer patterns used by spellcheck, compiled once at import time
+## instead of once per checked line or word
+_TOKEN_RE = re.compile(r"\w+|[^\w]+", re.UNICODE)
+_WORD_RE = re.compile(r"\w+")
+
+## Pattern matching one 'key [value]' line of the .gitmess file; the whole
+## file is scanned with a single findall instead of a Python-level loop of
+## strip/split calls
+_PARAM_LINE_RE = re.compile(r'^(\S+)(?:[ ](.*))?$', re.M)
+
+## Default commit-type menu, built once at module scope instead of on every
+## readParameters call
+_DEFAULT_MENU = (('feat', "New feature"),
+                 ('fix', "Bug fix"),
+                 ('chore', "Build process or auxiliary tool change"),
+                 ('docs', "Documentary only changes"),
+                 ('refactor', "Code that neither changes or add a feature"),
+                 ('style', "Markup, white-space, formatting..."),
+                 ('perf', "Code change that improves performance"),
+                 ('test', "Adding tests"),
+                 ('merge', 'Merging commits'),
+                 ('release', "Release version"))
+
+## Menu style per MultipleTypes value: inquirer question class name and
+## prompt message, resolved by lookup instead of rebuilding the message
+## string on every showMenu call
+_MENU_STYLES = {
+  'yes': ('Checkbox', "Select the type(s) of change you are committing "
+                      "(Press SPACE to select)"),
+  'no': ('List', "\033[FSelect the type of change you are committing "
+                 "(Press ENTER to select)\r\n"),
+}
+
+## Parameters whose value is an integer; only these go through int() so the
+## string-valued keys stop paying a ValueError on every parse
+_NUMERIC_PARAMS = frozenset({'MaxLength', 'WrapLength', 'ScopeLength',
+                             'SpellcheckMaxOptions'})
+
+## Action codes for the keystroke dispatch in getInput, plus a 256-entry
+## lookup table indexed by the byte value. Classifying a key becomes a
+## single table read instead of a ladder of ord() comparisons
+_KEY_IGNORE = 0
+_KEY_INSERT = 1
+_KEY_BACKSPACE = 2
+_KEY_ENTER = 3
+_KEY_ESCAPE = 4
+_KEY_INTERRUPT = 5
+_KEY_NEWLINE = 6
+
+_KEY_ACTIONS = bytearray(256)
+for _code in range(32, 256):
+  _KEY_ACTIONS[_code] = _KEY_INSERT
+_KEY_ACTIONS[3] = _KEY_INTERRUPT
+_KEY_ACTIONS[13] = _KEY_ENTER
+_KEY_ACTIONS[14] = _KEY_NEWLINE
+_KEY_ACTIONS[27] = _KEY_ESCAPE
+_KEY_ACTIONS[127] = _KEY_BACKSPACE
+_KEY_ACTIONS = bytes(_KEY_ACTIONS)
+
+## Cursor-up escape, with the repeats for typical frame heights precomputed
+## so the redraw path indexes a tuple instead of allocating a new string
+_BACKLINE = '\033[F'
+_BACKLINES = tuple(_BACKLINE * count for count in range(16))
+
+
+def _backlines(count):
+  """
+  Returns the escape string moving the cursor up count lines
+
+  Parameters
+  ----------
+  count: int
+    Number of lines to move up
+
+  Returns
+  -------
+  str
+    The escape sequence, precomputed for small counts
+
+  """
+  return _BACKLINES[count] if count < 16 else _BACKLINE * count
+
+## Cached terminal size. Reading the size is an ioctl syscall and getInput
+## needs it on every keystroke, so it is read once and then only refreshed
+## after the terminal is resized (SIGWINCH)
+_terminalSize = None
+_resizeHandlerInstalled = False
+
+
+def _onResize(signum=None, frame=None):
+  global _terminalSize
+  _terminalSize = None
+
+
+def _installResizeHandler():
+  global _resizeHandlerInstalled
+  if not _resizeHandlerInstalled and hasattr(signal, 'SIGWINCH'):
+    signal.signal(signal.SIGWINCH, _onResize)
+    _resizeHandlerInstalled = True
+
+
+def getTerminalSize():
+  """
+  Returns the terminal size, reading it from the system only when needed
+
+  The value is cached and invalidated by the SIGWINCH handler, so the
+  underlying ioctl only happens once per resize instead of once per call.
+
+  Returns
+  -------
+  os.terminal_size
+    Size of the terminal as returned by shutil.get_terminal_size
+
+  """
+  global _terminalSize
+  if _terminalSize is None:
+    _terminalSize = shutil.get_terminal_size()
+  return _terminalSize
+
 def main(args):
 
+  ## Registered once for the whole run so every prompt sees an up-to-date
+  ## cached terminal size without re-registering per input field
+  _installResizeHandler()
+
   parameters = readParameters()
   if args.config:
     dumpConfig(parameters)
@@ -40,7 +375,7 @@ def main(args):
     print("There is nothing staged to commit")
     return
 
-  if parameters.Spellcheck == "yes" and not spellchecker:
+  if parameters.Spellcheck == "yes" and not _hasSpellchecker():
     print("The module spellchecker is not installed")
     return
 
@@ -53,6 +388,11 @@ def main(args):
   types = []
   tagTitle = ["Tag name: ", ""]
 
+  ## Resolved once: these only depend on the (immutable) parameters, not on
+  ## anything the user edits inside the loop
+  formatTypes = _TYPES_FORMATTERS[parameters.TypesStyle]
+  headerLine = '=' * max(parameters.MaxLength, parameters.WrapLength)
+
   while not readyToCommit:
 
     if args.tag:
@@ -75,12 +415,7 @@ def main(args):
                      inputText=scope[1])
 
     ## Build the title message prefix
-    if parameters.TypesStyle == "comma":
-      typesPrefix = ','.join(types)
-    elif parameters.TypesStyle == "brackets":
-      typesPrefix = ""
-      for commitType in types:
-        typesPrefix += "[" + commitType + "]"
+    typesPrefix = formatTypes(types)
 
     ## If scope is not empty, add it to the title prefix
     if scope[1]:
@@ -95,39 +430,49 @@ def main(args):
                      blankChar=parameters.BlankChar,
                      inputText=title[1])
 
-    description = getInput(description[0],
-                           length=sys.maxsize,
-                           blankChar='',
-                           inputText=description[1],
-                           allowNewlines=True)
-
-    issueCode = getInput(issueCode[0],
-                         length=sys.maxsize,
-                         blankChar='',
-                         inputText=issueCode[1])
-
-    breakingChange = getInput(breakingChange[0],
-                              length=sys.maxsize,
-                              blankChar='',
-                              inputText=breakingChange[1])
+    ## The three free-text fields run back to back, so they share one
+    ## raw-mode session instead of flipping the terminal mode per prompt
+    (description, issueCode, breakingChange) = getInputs([
+      dict(prefix=description[0],
+           length=sys.maxsize,
+           blankChar='',
+           inputText=description[1],
+           allowNewlines=True),
+      dict(prefix=issueCode[0],
+           length=sys.maxsize,
+           blankChar='',
+           inputText=issueCode[1]),
+      dict(prefix=breakingChange[0],
+           length=sys.maxsize,
+           blankChar='',
+           inputText=breakingChange[1])])
 
     if parameters.Spellcheck == "yes":
       print("Starting spellchecking... ")
-      title[1] = spellcheck(title[1], parameters)
-      description[1] = spellcheck(description[1], parameters)
-      breakingChange[1] = spellcheck(breakingChange[1], parameters)
+      (title[1],
+       description[1],
+       breakingChange[1]) = spellcheckMany([title[1],
+                                            description[1],
+                                            breakingChange[1]], parameters)
       print("Spellchecking done")
       print()
 
-    while len(title[0] + title[1]) > parameters.MaxLength:
+    titleLength = len(title[0]) + len(title[1])
+    while titleLength > parameters.MaxLength:
       print("Length of corrected title is greater than maximum length allowed")
       print("Press enter to change it")
       input()
+      previousTitle = title[1]
       title = getInput(prefix=title[0],
                        length=parameters.MaxLength,
                        blankChar=parameters.BlankChar,
                        inputText=title[1])
-      title[1] = spellcheck(title[1], parameters)
+
+      ## Only re-run the spellchecker when the title actually changed; the
+      ## speller itself is the cached session instance
+      if parameters.Spellcheck == "yes" and title[1] != previousTitle:
+        title[1] = spellcheck(title[1], parameters)
+      titleLength = len(title[0]) + len(title[1])
 
 
     commitMessage = buildCommitMessage(title,
@@ -138,23 +483,22 @@ def main(args):
 
     if parameters.ConfirmCommit == "yes":
 
-      headerLength = max(parameters.MaxLength, parameters.WrapLength)
-
-      print('='*headerLength)
+      print(headerLine)
       print("COMMIT MESSAGE")
-      print('='*headerLength)
+      print(headerLine)
 
       if args.tag:
         print('\n' + 'Tag: ' + tagTitle[1])
 
       print('\n' + commitMessage + '\n')
-      print('='*headerLength)
+      print(headerLine)
 
       if args.simple_menus:
         shouldCommit = input("Do you want to commit with the above message? [(yes (y)/ edit (e) (default)/ no (n)]: ")
         if shouldCommit == "":
           shouldCommit = 'e'
       else:
+        inquirer = _inquirer()
         shouldCommit = inquirer.prompt(
           [inquirer.List('confirm',
                          message="Do you want to commit with the above message?",
@@ -165,7 +509,7 @@ def main(args):
       if shouldCommit == 'yes' or shouldCommit == "y":
         readyToCommit = True
       elif shouldCommit == 'edit' or shouldCommit == 'e':
-        shouldCommit == False
+        readyToCommit = False
       else:
         return
 
@@ -197,10 +541,106 @@ def somethingToCommit():
   bool
     True if there is something staged to be committed, False otherwise
   """
-  return subprocess.run(['git', 'diff', '--cached', '--quiet'],
-                        check=False).returncode == 1
+  return getGitState()[1]
+
+
+def _paramsCacheFilename():
+  """
+  Returns the path of the on-disk cache for the parsed parameters
+
+  The cache lives under the user cache directory and is keyed by a hash of
+  the repository root, so different repositories never share an entry.
+
+  Returns
+  -------
+  str
+    Full path of the pickle file caching the parsed parameters
+
+  """
+  cacheDir = os.environ.get('XDG_CACHE_HOME') or \
+      os.path.join(os.path.expanduser('~'), '.cache')
+  repoHash = hashlib.md5(getGitRoot().encode('utf-8')).hexdigest()
+
+  return os.path.join(cacheDir, 'gitmess', repoHash + '.pkl')
+
+
+def _loadCachedParams(parametersFile):
+  """
+  Returns the cached parameters if they are still valid, None otherwise
+
+  The cache entry stores the mtime and size of the .gitmess file it was
+  parsed from; any mismatch (or any problem reading the pickle) simply
+  falls back to a fresh parse.
+
+  Parameters
+  ----------
+  parametersFile: str
+    Full path of the .gitmess file
+
+  Returns
+  -------
+  Params or None
+    The cached parameters, or None when the cache is stale or unreadable
+
+  """
+  try:
+    with open(_paramsCacheFilename(), 'rb') as fid:
+      (cacheKey, params) = pickle.load(fid)
+    stat = os.stat(parametersFile)
+    if cacheKey == (stat.st_mtime_ns, stat.st_size):
+      return params
+  except (OSError, pickle.PickleError, EOFError, AttributeError,
+          TypeError, ValueError):
+    pass
+
+  return None
+
+
+def _storeCachedParams(parametersFile, params):
+  """
+  Stores the parsed parameters in the on-disk cache
+
+  Failures are ignored: the cache is a pure optimization and the next run
+  will parse the file again.
+
+  Parameters
+  ----------
+  parametersFile: str
+    Full path of the .gitmess file the parameters were parsed from
+  params: Params
+    Parsed parameters to cache
+
+  Returns
+  -------
+  None
+
+  """
+  try:
+    stat = os.stat(parametersFile)
+    cacheFilename = _paramsCacheFilename()
+    os.makedirs(os.path.dirname(cacheFilename), exist_ok=True)
+    with open(cacheFilename, 'wb') as fid:
+      pickle.dump(((stat.st_mtime_ns, stat.st_size), params), fid)
+  except OSError:
+    pass
+
+
+def _dropCachedParams():
+  """
+  Removes the on-disk parameters cache for the current repository
+
+  Returns
+  -------
+  None
+
+  """
+  try:
+    os.remove(_paramsCacheFilename())
+  except OSError:
+    pass
 
 
+@functools.lru_cache(maxsize=1)
 def readParameters():
   """
   Read the parameters configuration file in current project
@@ -210,29 +650,31 @@ def readParameters():
 
   If not file is presented then default values are used
 
+  The parameters never change during a single run, so the result is cached
+  for the lifetime of the process. Call readParameters.cache_clear() to force
+  a re-read of the configuration file.
+
   Parameters
   ----------
 
 
   Returns
   -------
-  namedtuple
+  Params
     Structure with all the configuration parameters
 
   """
 
   parametersFile = getParametersFilename()
 
-  defaultMenu = [('feat', "New feature"),
-                 ('fix', "Bug fix"),
-                 ('chore', "Build process or auxiliary tool change"),
-                 ('docs', "Documentary only changes"),
-                 ('refactor', "Code that neither changes or add a feature"),
-                 ('style', "Markup, white-space, formatting..."),
-                 ('perf', "Code change that improves performance"),
-                 ('test', "Adding tests"),
-                 ('merge', 'Merging commits'),
-                 ('release', "Release version")]
+  ## Warm runs skip the parse entirely when the on-disk cache still matches
+  ## the mtime and size of the .gitmess file
+  hasParametersFile = os.path.isfile(parametersFile)
+  if hasParametersFile:
+    cached = _loadCachedParams(parametersFile)
+    if cached is not None:
+      return cached
+
   params = {}
   params['UseDefaultMenu'] = 'yes'
   params['MaxLength'] = 70
@@ -248,23 +690,21 @@ def readParameters():
   params['userTypes'] = []
 
 
-  if os.path.isfile(parametersFile):
-
-    paramsfid = open(parametersFile, 'r')
+  if hasParametersFile:
 
-    for line in paramsfid:
-      try:
-        (key, value) = line.strip('\n').split(' ', maxsplit=1)
-      except ValueError:
-        key = line.strip('\n')
-        value = ''
+    with open(parametersFile, 'r') as paramsfid:
+      text = paramsfid.read()
 
+    for (key, value) in _PARAM_LINE_RE.findall(text):
 
-      # Try to parse to an integer. If it is not an int, then convert the
-      # string to lower case
-      try:
-        value = int(value)
-      except ValueError:
+      # Parse the known numeric parameters to an integer; any other value is
+      # converted to lower case
+      if key in _NUMERIC_PARAMS:
+        try:
+          value = int(value)
+        except ValueError:
+          value = value.lower()
+      else:
         value = value.lower()
 
       if key == 'AddType':
@@ -276,12 +716,13 @@ def readParameters():
 
   # Build commit types based on default values (if required)
   if params['UseDefaultMenu'] == 'yes':
-    params['menu'] = defaultMenu
+    params['menu'] = list(_DEFAULT_MENU)
   elif params['UseDefaultMenu'] == 'no':
     params['menu'] = []
   else:
     types2keep = params['UseDefaultMenu'].split(' ')
-    params['menu'] = [entry for entry in defaultMenu if entry[0] in types2keep]
+    params['menu'] = [entry for entry in _DEFAULT_MENU
+                      if entry[0] in types2keep]
 
   # Extend commit types with user defined types
   params['menu'].extend(params['userTypes'])
@@ -291,14 +732,46 @@ def readParameters():
   if params['SpellcheckMaxOptions'] < 1:
     params['SpellcheckMaxOptions'] = sys.maxsize
 
-  tupleConstructor = namedtuple('params', ' '.join(sorted(params.keys())))
+  params['menu'] = tuple(params['menu'])
+  params['userTypes'] = tuple(params['userTypes'])
+
+  # Unknown keys in the configuration file are ignored
+  knownFields = Params.__dataclass_fields__
+
+  result = Params(**{key: value for (key, value) in params.items()
+                     if key in knownFields})
+
+  if hasParametersFile:
+    _storeCachedParams(parametersFile, result)
+
+  return result
+
+
+@functools.lru_cache(maxsize=1)
+def _menuChoices(menu):
+  """
+  Returns the 'label: text' menu choices for the given menu
+
+  The menu is immutable for the whole run but the edit loop in main shows
+  it again on every pass, so the choices handed to the prompts are built
+  once and cached instead of rebuilt per iteration.
+
+  Parameters
+  ----------
+  menu: tuple
+    Menu entries as (label, text) tuples
+
+  Returns
+  -------
+  tuple
+    Menu choices as (display, label) tuples
 
-  return tupleConstructor(**params)
+  """
+  return tuple((label + ': ' + text, label) for (label, text) in menu)
 
 
 def showNumberedMenu(params, defaults=None):
-  menuQuestions = [ (label + ': ' + text, label)
-                    for (label, text) in params.menu ]
+  menuQuestions = _menuChoices(params.menu)
 
   labels = [label for (label, text) in params.menu]
 
@@ -346,7 +819,7 @@ def showMenu(params, defaults=None):
 
   Parameters
   ----------
-  params: namedtuple
+  params: Params
     Structure with commit parameters
   defaults: list
     Value(s) to be selected by default when prompting the menu
@@ -368,29 +841,35 @@ def showMenu(params, defaults=None):
   """
 
   # Create the text for the menu composed of label: type
-  menuQuestions = [ (label + ': ' + text, label)
-                    for (label, text) in params.menu ]
+  menuQuestions = _menuChoices(params.menu)
 
-  if params.MultipleTypes == 'yes':
-    menuType = inquirer.Checkbox
-    menuMessage = "Select the type(s) of change you are committing " + \
-      "(Press SPACE to select)"
-  else:
-    menuType = inquirer.List
-    menuMessage = "\033[FSelect the type of change you are committing " + \
-      "(Press ENTER to select)\r\n"
-    if defaults:
-      defaults = defaults[0]
-
-  questions = [
-  menuType('type',
-           message=menuMessage,
-           choices=menuQuestions,
-           default=defaults)
-  ]
+  ## inquirer redraws every choice on each keypress, so menus taller than
+  ## the terminal (many AddType entries) are shown one page at a time to
+  ## keep the redraw cost bounded by the terminal height
+  pageSize = max(4, getTerminalSize().lines - 6)
+
+  inquirer = _inquirer()
+
+  (menuTypeName, menuMessage) = _MENU_STYLES['yes' if params.MultipleTypes ==
+                                             'yes' else 'no']
+  menuType = getattr(inquirer, menuTypeName)
+
+  if menuType is inquirer.List and defaults:
+    defaults = defaults[0]
 
   print()
-  choices = inquirer.prompt(questions)['type']
+  if len(menuQuestions) > pageSize:
+    choices = promptPagedMenu(menuType, menuMessage, menuQuestions,
+                              defaults, pageSize)
+  else:
+    questions = [
+    menuType('type',
+             message=menuMessage,
+             choices=menuQuestions,
+             default=defaults)
+    ]
+
+    choices = inquirer.prompt(questions)['type']
 
   if len(choices) == 0:
     raise RuntimeError("Please choice a type")
@@ -402,6 +881,101 @@ def showMenu(params, defaults=None):
   return choices
 
 
+def promptPagedMenu(menuType, menuMessage, menuQuestions, defaults, pageSize):
+  """
+  Prompts a long menu as a sequence of terminal-sized pages
+
+  Only one page of choices is handed to inquirer at a time, so the
+  per-keypress redraw stays bounded by the terminal height no matter how
+  many commit types are configured. Single-choice menus get navigation
+  entries to move between the pages; multiple-choice menus show the pages
+  one after the other and accumulate the selections.
+
+  Parameters
+  ----------
+  menuType: class
+    inquirer question class to use (List or Checkbox)
+  menuMessage: str
+    Message shown on top of the menu
+  menuQuestions: list
+    Full list of (display, label) menu choices
+  defaults: list or str
+    Value(s) to be selected by default
+  pageSize: int
+    Maximum number of menu entries shown at once
+
+  Returns
+  -------
+  list or str
+    Choice(s) chosen by the user, in the same shape inquirer returns them
+
+  """
+
+  pages = [menuQuestions[idx:idx+pageSize]
+           for idx in range(0, len(menuQuestions), pageSize)]
+
+  inquirer = _inquirer()
+
+  if menuType is inquirer.Checkbox:
+    choices = []
+    for page in pages:
+      questions = [menuType('type', message=menuMessage, choices=page,
+                            default=defaults)]
+      choices.extend(inquirer.prompt(questions)['type'])
+    return choices
+
+  nextEntry = ('-- next page --', '__next__')
+  previousEntry = ('-- previous page --', '__previous__')
+
+  page = 0
+  while True:
+    pageChoices = list(pages[page])
+    if page > 0:
+      pageChoices.append(previousEntry)
+    if page < len(pages) - 1:
+      pageChoices.append(nextEntry)
+
+    questions = [menuType('type', message=menuMessage, choices=pageChoices,
+                          default=defaults)]
+    choice = inquirer.prompt(questions)['type']
+
+    if choice == '__next__':
+      page += 1
+    elif choice == '__previous__':
+      page -= 1
+    else:
+      return choice
+
+
+## Reusable text wrapper built on first use; textwrap.wrap would construct
+## a fresh TextWrapper (and its internal machinery) on every call, and only
+## the commit-building path needs the module at all
+_textWrapperInstance = None
+
+
+def _textWrapper(width):
+  """
+  Returns the shared TextWrapper configured for the given width
+
+  Parameters
+  ----------
+  width: int
+    Maximum length of the wrapped lines
+
+  Returns
+  -------
+  textwrap.TextWrapper
+    The shared wrapper instance
+
+  """
+  global _textWrapperInstance
+  if _textWrapperInstance is None:
+    import textwrap
+    _textWrapperInstance = textwrap.TextWrapper()
+  _textWrapperInstance.width = width
+  return _textWrapperInstance
+
+
 def buildCommitMessage(title, description, issue, breaking, params):
   """
   Builds the final commit message based on all the user inputs.
@@ -416,7 +990,7 @@ def buildCommitMessage(title, description, issue, breaking, params):
     Tuple of strings with the prefix and the issue code entered by the user
   breaking: tuple
     Tuple of strings with the prefix and the breaking changes entered by the user
-  params: namedtuple
+  params: Params
     Structure with the commit parameters
 
   Returns
@@ -426,19 +1000,68 @@ def buildCommitMessage(title, description, issue, breaking, params):
 
   """
 
-  message = title[0] + title[1]
+  parts = [title[0] + title[1]]
 
   if description[1]:
-    linesWrapped = list(map(lambda l: '\n'.join(textwrap.wrap(l, width=params.WrapLength)),
+    wrapper = _textWrapper(params.WrapLength)
+    linesWrapped = list(map(lambda l: '\n'.join(wrapper.wrap(l)),
                             description[1].split('\n')))
-    message += '\n\n' +  '\n'.join(linesWrapped)
+    parts.append('\n'.join(linesWrapped))
+
   if issue[1]:
-    message += '\n\n' + issue[0] + ': ' + issue[1]
+    parts.append(issue[0] + ': ' + issue[1])
 
   if breaking[1]:
-    message += '\n\n' + breaking[0] + ': ' + breaking[1]
+    parts.append(breaking[0] + ': ' + breaking[1])
+
+  return '\n\n'.join(parts)
+
+
+class _RawMode:
+  """
+  Context manager keeping the terminal in raw mode for a whole input session
 
-  return message
+  Entering and leaving raw mode costs several termios syscalls, so instead
+  of paying them on every read the mode is set once on entry and the
+  previous terminal settings are restored on exit (also when the user
+  interrupts with ctrl+c). Output post-processing is kept enabled so
+  newlines printed during the session still behave normally.
+
+  The manager is re-entrant: nesting (e.g. getInputs wrapping several
+  getInput prompts) only touches the terminal on the outermost enter and
+  exit, so consecutive prompts share one raw-mode session.
+
+  """
+
+  ## Nesting depth and the settings saved by the outermost enter, shared by
+  ## all instances since they all act on the same terminal
+  _depth = 0
+  _savedSettings = None
+
+  def __init__(self, fileDescriptor):
+    self.fileDescriptor = fileDescriptor
+
+  def __enter__(self):
+    if _RawMode._depth == 0:
+      import termios
+      import tty
+      _RawMode._savedSettings = termios.tcgetattr(self.fileDescriptor)
+      tty.setraw(self.fileDescriptor)
+
+      # Re-enable output post-processing so '\n' keeps translating to '\r\n'
+      mode = termios.tcgetattr(self.fileDescriptor)
+      mode[1] |= termios.OPOST | termios.ONLCR
+      termios.tcsetattr(self.fileDescriptor, termios.TCSADRAIN, mode)
+    _RawMode._depth += 1
+    return self
+
+  def __exit__(self, excType, excValue, traceback):
+    _RawMode._depth -= 1
+    if _RawMode._depth == 0:
+      import termios
+      termios.tcsetattr(self.fileDescriptor, termios.TCSADRAIN,
+                        _RawMode._savedSettings)
+    return False
 
 
 def getChar():
@@ -446,7 +1069,11 @@ def getChar():
 
   Reads a character typed in the keyboard
 
-  This function read a single character pressed by the user and returns it
+  This function read a single character pressed by the user and returns it.
+  The terminal is expected to be in raw mode already (see _RawMode). The
+  byte is read straight from the file descriptor, bypassing the buffered
+  text layer so pending input stays visible to select; multi-byte UTF-8
+  sequences are completed before decoding.
 
 
   Parameters
@@ -460,13 +1087,32 @@ def getChar():
   """
 
   fileDescriptor = sys.stdin.fileno()
-  oldSettings = termios.tcgetattr(fileDescriptor)
-  try:
-    tty.setraw(fileDescriptor)
-    char = sys.stdin.read(1)
-  finally:
-    termios.tcsetattr(fileDescriptor, termios.TCSADRAIN, oldSettings)
-  return char
+  data = os.read(fileDescriptor, 1)
+  if not data:
+    return ''
+
+  code = data[0]
+  if code < 0x80:
+    return chr(code)
+
+  # UTF-8 lead byte: read the continuation bytes before decoding
+  if code >= 0xF0:
+    remaining = 3
+  elif code >= 0xE0:
+    remaining = 2
+  elif code >= 0xC0:
+    remaining = 1
+  else:
+    remaining = 0
+
+  while remaining > 0:
+    more = os.read(fileDescriptor, remaining)
+    if not more:
+      break
+    data += more
+    remaining -= len(more)
+
+  return data.decode('utf-8', 'replace')
 
 
 def getInput(prefix='', length=80, blankChar='_', inputText='', allowNewlines=False):
@@ -511,88 +1157,213 @@ def getInput(prefix='', length=80, blankChar='_', inputText='', allowNewlines=Fa
 
   """
 
-  ## TODO Set to global variable
-  backline='\033[F'
-
   lenPrefix = len(prefix)
 
-  cursorPos = lenPrefix
-
-  userInput = inputText[:(length-len(prefix))]
-  cursorPos += len(userInput)
+  ## The editable text is stored as a gap buffer: the characters before the
+  ## cursor live in left, the characters after the cursor live in right in
+  ## reversed order. Inserting and deleting at the cursor are O(1) list
+  ## operations instead of rebuilding the whole string every keystroke. The
+  ## string is only materialized when a full repaint is needed
+  left = list(inputText[:(length-lenPrefix)])
+  right = []
+  newlineCount = left.count('\n')
+
+  ## Unlimited-length prompts (description, issue code, breaking changes)
+  ## have no capacity to enforce, so their keystroke loop skips the length
+  ## comparisons entirely
+  hasLimit = length != sys.maxsize
+
+  ## Blank padding template built once per session; the pad of any redraw is
+  ## an O(1) slice of this string instead of a fresh multiplication.
+  ## Unlimited-length fields are never padded: building their pad would try
+  ## to allocate a near-infinite string
+  if blankChar and hasLimit:
+    padTemplate = blankChar * max(length - lenPrefix, 0)
+  else:
+    padTemplate = ''
 
-  messageLine = prefix + userInput + (length - len(userInput) - lenPrefix) * blankChar
+  messageLine = prefix + ''.join(left) + padTemplate[:length - len(left) - lenPrefix]
   maxLengthMessage = len(messageLine)
 
-  (nlines, cursorLine) = printMessageWrapped(messageLine, cursorPos)
+  cols = getTerminalSize().columns - 5
 
-  escapeNext = 0
+  (text, nlines, cursorLine) = formatMessageWrapped(messageLine,
+                                                    lenPrefix + len(left), cols)
+  sys.stdout.write(text)
+  sys.stdout.flush()
 
-  while True:
+  ## Holds characters read ahead while draining a paste burst; they are
+  ## processed on the next loop iterations
+  pendingChars = []
 
-    char = str(getChar())
+  with _RawMode(sys.stdin.fileno()):
+    while True:
+
+      if pendingChars:
+        char = pendingChars.pop()
+      else:
+        char = getChar()
+
+      ## Incremental redraw: when the message fits on a single terminal line,
+      ## edits at the end of the input and plain cursor moves only need a few
+      ## bytes written instead of a full repaint. quickDraw holds that escape
+      ## sequence; None means the full repaint below is required.
+      quickDraw = None
+      cols = getTerminalSize().columns - 5
+      textLen = lenPrefix + len(left) + len(right)
+      displayLen = length if blankChar else textLen
+      singleLine = (newlineCount == 0) and (displayLen + 1 < cols)
+
+      code = ord(char)
+      action = _KEY_ACTIONS[code] if code < 256 else _KEY_INSERT
+
+      if action == _KEY_INSERT: #Write only letters numbers and symbols
+        if hasLimit and textLen == length: ## If already at the end, don't do anything
+          continue
 
-    ## If the arrow key are pressed they produced first a escape sequence and
-    ## then the arrow key code, so this handles that
-    if escapeNext > 0:
-      escapeNext -= 1
-      if ord(char) == 68 and (cursorPos > lenPrefix):
-        cursorPos -= 1
-      elif (ord(char) == 67) and (cursorPos < lenPrefix + len(userInput)):
-        cursorPos +=1
+        ## Drain keystrokes that are already pending (typically a paste burst)
+        ## so N buffered characters cost one redraw instead of N. The burst is
+        ## fetched with bulk reads (one syscall per 4096 bytes rather than one
+        ## per character); a control character ends the batch and it and the
+        ## remainder are replayed in order on the next iterations
+        pendingBytes = bytearray()
+        while (len(pendingBytes) < 65536 and
+               select.select([sys.stdin], [], [], 0)[0]):
+          pendingBytes += os.read(sys.stdin.fileno(), 4096)
+
+        batch = char
+        drained = pendingBytes.decode('utf-8', 'replace')
+        for (idx, nextChar) in enumerate(drained):
+          nextCode = ord(nextChar)
+          nextAction = _KEY_ACTIONS[nextCode] if nextCode < 256 else _KEY_INSERT
+          if (nextAction != _KEY_INSERT or
+              (hasLimit and textLen + len(batch) >= length)):
+            pendingChars.extend(reversed(drained[idx:]))
+            break
+          batch += nextChar
+
+        left.extend(batch)
+        if singleLine and (blankChar or displayLen + len(batch) + 1 < cols):
+          if right:
+            ## Mid-line insert: rewrite the shifted tail and move the cursor
+            ## back over it instead of repainting the whole line
+            tail = ''.join(reversed(right))
+            quickDraw = batch + tail + '\033[' + str(len(tail)) + 'D'
+          else:
+            quickDraw = batch
+      elif action == _KEY_BACKSPACE:
+        # Remove character if backspace
+        if left:
+          if left.pop() == '\n':
+            newlineCount -= 1
+          elif singleLine:
+            fill = blankChar if blankChar else ' '
+            if right:
+              ## Mid-line delete: pull the tail one cell left and refill the
+              ## vacated cell, then move the cursor back over the tail
+              tail = ''.join(reversed(right))
+              quickDraw = ('\b' + tail + fill +
+                           '\033[' + str(len(tail) + 1) + 'D')
+            else:
+              quickDraw = '\b' + fill + '\b'
+        else:
+          quickDraw = ''
+
+      elif action == _KEY_ENTER: ## Input finished
+        break
+      elif action == _KEY_ESCAPE:
+        ## Arrow keys arrive as a three-byte sequence (ESC [ code); the two
+        ## remaining bytes are consumed right away instead of threading a
+        ## state machine through the next loop iterations
+        seq = ''
+        while len(seq) < 2:
+          seq += pendingChars.pop() if pendingChars else getChar()
+        arrowCode = ord(seq[1])
+        if arrowCode == 68 and left:
+          right.append(left.pop())
+          if singleLine:
+            quickDraw = '\033[D'
+        elif arrowCode == 67 and right:
+          left.append(right.pop())
+          if singleLine:
+            quickDraw = '\033[C'
+        else:
+          continue
+      elif action == _KEY_INTERRUPT: ## Ctrl+c pressed -> interrupt
+        raise KeyboardInterrupt
+      elif action == _KEY_NEWLINE and allowNewlines:
+        if hasLimit and textLen == length:
+          continue
+        left.append('\n')
+        newlineCount += 1
       else:
         continue
-    elif ord(char) == 127: ## 127 = backspace -> erase character
-      # Remove character if backspace
 
-      cursorPosWord = cursorPos - lenPrefix
+      if quickDraw is not None:
+        if quickDraw:
+          sys.stdout.write(quickDraw)
+          sys.stdout.flush()
+        continue
 
-      if cursorPosWord > 0:
-        userInput = userInput[:(cursorPosWord-1)] + userInput[(cursorPosWord):]
-        cursorPos -= 1
+      userInput = ''.join(left) + ''.join(reversed(right))
+      messageLine = prefix + userInput + padTemplate[:length - len(userInput) - lenPrefix]
 
-    elif ord(char) == 13: ## 13: enter. Input finished
-      break
-    elif ord(char) == 27: ## 27: first character sent when arrow key pressed
-      escapeNext = 2
-    elif ord(char) == 3: ## Ctrl+c pressed -> interrupt
-      raise KeyboardInterrupt
-    elif len(userInput) + lenPrefix == length: ## If already at the end, don't do anything
-      continue
-    elif ord(char) == 14 and allowNewlines:
-      cursorPosWord = cursorPos - lenPrefix
-      userInput = userInput[:cursorPosWord] + '\n' + userInput[cursorPosWord:]
-      cursorPos += 1
-    elif ord(char) >= 32: #Write only letters numbers and symbols
-      cursorPosWord = cursorPos - lenPrefix
-      userInput = userInput[:cursorPosWord] + char + userInput[cursorPosWord:]
-      cursorPos += 1
-
-    # Bring back cursor to the very beginning of the input line
-    print('\r', end='')
-    print(backline*cursorLine, end='')
-
-    messageLine = prefix + userInput + (length - len(userInput) - lenPrefix) * blankChar
-
-    # Clean any old input before writing new line
-    cleanTerminal(nlines)
-
-    # Print the user input in a formatted way
-    (nlines, cursorLine) = printMessageWrapped(messageLine, cursorPos)
+      # Assemble the whole repaint in one buffer: cursor back to the very
+      # beginning of the input line, erase-below escape to drop the old
+      # frame, then the new formatted input. One write and one flush per
+      # keystroke; the escape replaces a full screen-width wipe line by line
+      buf = ['\r', _backlines(cursorLine), '\033[J']
+
+      (text, nlines, cursorLine) = formatMessageWrapped(messageLine,
+                                                        lenPrefix + len(left), cols)
+      buf.append(text)
+      sys.stdout.write(''.join(buf))
+      sys.stdout.flush()
 
   # Print enough new line so the new input does not overlap with this input
-  print('\n'*(nlines - cursorLine), flush=True)
-  return [prefix, userInput]
+  sys.stdout.write('\n'*(nlines - cursorLine + 1))
+  sys.stdout.flush()
+  return [prefix, ''.join(left) + ''.join(reversed(right))]
+
+
+def getInputs(prompts):
+  """
+  Prompts several input fields in a single raw-mode session
+
+  Each prompt still behaves exactly like a getInput call; wrapping them in
+  one _RawMode context means the terminal mode is saved, set and restored
+  once for the whole sequence instead of once per field.
+
+  Parameters
+  ----------
+  prompts: list
+    List of dictionaries with the keyword arguments for each getInput call
+
+  Returns
+  -------
+  list
+    The getInput result for each prompt, in order
+
+  """
 
+  results = []
+  with _RawMode(sys.stdin.fileno()):
+    for prompt in prompts:
+      results.append(getInput(**prompt))
 
-def printMessageWrapped(message, cursorPos):
+  return results
+
+
+def formatMessageWrapped(message, cursorPos, cols=None):
   """
-  Print a wrapped string in the terminal and sets the cursor to a specific
+  Format a wrapped string for the terminal with the cursor at a specific
   location
 
-  The function gets the size of the current terminal and breaks the string
-  into several lines and then prints those lines. Also the cursor is placed in
-  a specific location using the parameters cursorPos
+  The function breaks the string into several lines of at most cols
+  characters and returns the text to emit, including the escape sequences
+  that place the cursor at the position given by cursorPos. The caller is
+  in charge of writing the result, so a whole keystroke can be flushed to
+  the terminal in one write
 
   Parameters
   ----------
@@ -601,20 +1372,30 @@ def printMessageWrapped(message, cursorPos):
   cursorPos: int
     The position where the cursor should be placed. The beginning of the string
     is 0
+  cols: int, optional
+    Width used to wrap the message. When not given, it is derived from the
+    cached terminal size
 
   Returns
   -------
   tuple
-    Tuple with the total number of lines and the line of the current cursor position
+    Tuple with the text to write, the total number of lines and the line of
+    the current cursor position
 
   """
 
-  terminalSize = shutil.get_terminal_size()
   margin = 5
-  cols = terminalSize.columns - margin
-
-  # Special character to move the cursor up one line
-  backline = '\033[F'
+  if cols is None:
+    cols = getTerminalSize().columns - margin
+
+  ## Fast path: the whole message fits on one terminal line and has no
+  ## manual breaks, which is the common case for the title and scope
+  ## prompts. The wrap bookkeeping below is skipped entirely
+  if len(message) < cols and '\n' not in message:
+    out = message + ' \r'
+    if cursorPos > 0:
+      out += '\033[' + str(cursorPos) + 'C'
+    return (out, 1, 0)
 
   nlines = len(message) // cols + 1
   cursorLine = 0
@@ -657,18 +1438,19 @@ def printMessageWrapped(message, cursorPos):
     linesBeforeCursor.append('')
 
   nlines = len(linesTotal)
-  cursorLine = len(linesBeforeCursor) - 1
-
-  # First print the entire message
-  print('\n'.join([l+' ' for l in linesTotal]), end='')
-
-  #bring back cursor to the beginning of message
-  print('\r' + backline*(nlines-1), end='')
+  cursorLine = max(len(linesBeforeCursor) - 1, 0)
+  cursorCol = len(linesBeforeCursor[-1]) if linesBeforeCursor else 0
 
-  #print until cursor
-  print('\n'.join(linesBeforeCursor), end='', flush=True)
+  # Assemble the whole redraw in one buffer: the entire message, then the
+  # cursor moved straight to its position with escape codes instead of
+  # re-emitting every line before it. Joining with ' \n' appends the
+  # trailing space of each line without building an intermediate list
+  out = [' \n'.join(linesTotal), ' ',
+         '\r' + _backlines(nlines - 1 - cursorLine)]
+  if cursorCol:
+    out.append('\033[' + str(cursorCol) + 'C')
 
-  return (nlines, cursorLine)
+  return (''.join(out), nlines, cursorLine)
 
 
 def commit(message, params):
@@ -679,7 +1461,7 @@ def commit(message, params):
   ----------
   message: str
     Commit message already formatted
-  params: namedtuple
+  params: Params
     Structure with the commit parameters
 
   Returns
@@ -688,7 +1470,11 @@ def commit(message, params):
 
   """
 
-  subprocess.run(['git', 'commit', '--message', message], check=True)
+  ## The message goes through stdin (-F -) instead of argv, so its size is
+  ## not bounded by the argument-list limit and no extra copy is marshalled
+  ## through exec
+  subprocess.run(['git', 'commit', '-F', '-'], input=message, text=True,
+                 check=True)
 
 
 def tag(tagTitle, message, params):
@@ -701,7 +1487,7 @@ def tag(tagTitle, message, params):
     Tag title label
   message: str
     Commit message already formatted
-  params: namedtuple
+  params: Params
     Structure with the commit parameters
 
   Returns
@@ -710,7 +1496,8 @@ def tag(tagTitle, message, params):
 
   """
 
-  subprocess.run(['git', 'tag', '--annotate', tagTitle, '--message', message], check=True)
+  subprocess.run(['git', 'tag', '--annotate', tagTitle, '-F', '-'],
+                 input=message, text=True, check=True)
 
 
 
@@ -720,7 +1507,7 @@ def dumpConfig(params):
 
   Parameters
   ----------
-  params: namedtuple
+  params: Params
     Structure with the commit parameters
 
   Returns
@@ -733,14 +1520,95 @@ def dumpConfig(params):
 
   if not os.path.isfile(parametersFile):
     with open(parametersFile, 'w+') as fid:
-      for (key, value) in params._asdict().items():
+      for (key, value) in asdict(params).items():
         if key not in ['menu', 'userTypes']:
           print(key + ' ' + str(value), file=fid)
+    ## The configuration just changed on disk, so the cached parse (if any)
+    ## must not survive this run
+    _dropCachedParams()
   else:
     print("Configuration file already exists")
 
 
-def spellcheck(message, params):
+@functools.lru_cache(maxsize=256)
+def _wordPattern(word):
+  """
+  Returns a compiled case-insensitive pattern matching the given word
+
+  Compiled patterns are cached so correcting the same word several times in
+  a message does not recompile the regex.
+
+  Parameters
+  ----------
+  word: str
+    Word to be matched literally
+
+  Returns
+  -------
+  re.Pattern
+    Compiled case-insensitive pattern for the word
+
+  """
+  return re.compile(re.escape(word), re.IGNORECASE)
+
+
+def getSpeller(params):
+  """
+  Returns the aspell speller for the configured language
+
+  Constructing a speller loads the whole language dictionary from disk, so
+  the instance is built lazily on first use and cached for the rest of the
+  process.
+
+  Parameters
+  ----------
+  params: Params
+    Structure with the commit parameters
+
+  Returns
+  -------
+  aspell.Speller
+    Speller for the configured spellcheck language
+
+  """
+  lang = _LANG_CODES[params.SpellcheckLanguage.lower()]
+  if lang not in _spellerCache:
+    import aspell
+    _spellerCache[lang] = aspell.Speller('lang', lang)
+  return _spellerCache[lang]
+
+
+def spellcheckMany(messages, params):
+  """
+  Spell check several strings in one session.
+
+  All the messages share a single speller instance, so the language
+  dictionary is loaded at most once for the whole batch.
+
+  Parameters
+  ----------
+  messages: list
+    List of strings to be checked
+  params: Params
+    Structure with the commit parameters
+
+  Returns
+  -------
+  list
+    The corrected messages, in the same order as the input
+
+  """
+
+  spell = None
+  for message in messages:
+    if message.strip():
+      spell = getSpeller(params)
+      break
+
+  return [spellcheck(message, params, spell) for message in messages]
+
+
+def spellcheck(message, params, spell=None):
   """
   Spell check a given string.
 
@@ -751,8 +1619,10 @@ def spellcheck(message, params):
   ----------
   message: str
     The string to be checked
-  params: namedtuple
+  params: Params
     Structure with the commit parameters
+  spell: aspell.Speller, optional
+    Speller to be used. When not given, the shared session speller is used
 
   Returns
   -------
@@ -761,36 +1631,44 @@ def spellcheck(message, params):
 
   """
 
-  langDict = {
-    'english': 'en',
-    'spanish': 'es',
-    'deutch': 'de',
-    'french': 'fr',
-    'portuguese': 'pt'
-  }
+  ## Nothing to check: skip the speller construction altogether
+  if not message.strip():
+    return message
 
   context = 3
 
-  spell = spellchecker.Speller('lang', langDict[params.SpellcheckLanguage.lower()])
+  if spell is None:
+    spell = getSpeller(params)
 
   correctedMessage = []
 
+  ## Corrections already chosen in this message, keyed by the original word.
+  ## A word misspelled several times is only prompted (and suggested) once;
+  ## later occurrences reuse the same correction
+  corrections = {}
+
   for line in message.split('\n'):
 
     correctedLine = []
-    lineSplit = re.findall(r"\w+|[^\w]+", line, re.UNICODE)
+    lineSplit = _TOKEN_RE.findall(line)
 
     for jdx, word in enumerate(lineSplit):
 
-      if re.match('\w+', word):
+      if _WORD_RE.match(word):
+        knownCorrection = corrections.get(word)
+        if knownCorrection is not None:
+          correctedLine.append(knownCorrection)
+          continue
         corrected = spell.check(word)
       else:
         corrected = True
 
+      wasMisspelled = not corrected
       userInput = ""
       userWord = ""
       originalWord = word
       correctedWord = word
+      wrongReg = _wordPattern(originalWord)
 
       while not corrected:
 
@@ -833,32 +1711,35 @@ def spellcheck(message, params):
             continue
           elif idx > 0:
             newWord = listCandidates[idx-1]
-            wrongReg = re.compile(re.escape(originalWord), re.IGNORECASE)
             correctedWord = wrongReg.sub(newWord, originalWord)
           elif idx == -2:
             spell.addtoPersonal(word)
             spell.saveAllwords()
-            wrongReg = re.compile(re.escape(originalWord), re.IGNORECASE)
             correctedWord = wrongReg.sub(word, originalWord)
           corrected = True
         except ValueError:
           if spell.check(userInput):
-            wrongReg = re.compile(re.escape(originalWord), re.IGNORECASE)
             correctedWord = wrongReg.sub(userInput, originalWord)
             corrected = True
           else:
             newCandidates = spell.suggest(userInput)
             word = userInput.rstrip('\n')
 
+      if wasMisspelled:
+        corrections[originalWord] = correctedWord
       correctedLine.append(correctedWord)
     correctedMessage.append(''.join(correctedLine))
   return '\n'.join(correctedMessage)
 
 
+@functools.lru_cache(maxsize=1)
 def getParametersFilename():
   """
   Returns the full path filename for the parameters file
 
+  The result is memoized: both readParameters and dumpConfig ask for it and
+  the answer cannot change within one run.
+
   Returns
   -------
   str
@@ -866,11 +1747,27 @@ def getParametersFilename():
 
   """
   basename = '.gitmess'
-  rootDirectory = subprocess.run(['git', 'rev-parse', '--show-toplevel'],
-                                 capture_output=True, check=True
-                                ).stdout.decode('utf-8').rstrip('\n')
+  return os.path.join(getGitRoot(), basename)
 
-  return rootDirectory + '/' + basename
+
+def getGitRoot():
+  """
+  Returns the root directory of the current git repository
+
+  The result is cached per working directory, so git is only invoked once
+  per process no matter how many times this function is called.
+
+  Returns
+  -------
+  str
+    Full path of the repository root directory
+
+  """
+  cwd = os.getcwd()
+  if cwd not in _gitRootCache:
+    _gitRootCache[cwd] = getGitState()[0]
+
+  return _gitRootCache[cwd]
 
 
 def getContext(message, idx, context):
@@ -895,19 +1792,6 @@ def getContext(message, idx, context):
   return previousWords, nextWords
 
 
-def cleanTerminal(nlines):
-  terminalSize = shutil.get_terminal_size()
-  margin = 1
-  cols = terminalSize.columns - margin
-
-  # Special character to move the cursor up one line
-  backline = '\033[F'
-
-  print('\n'.join([' '*cols]*nlines), end='')
-  print('\r',end='')
-  print(backline*(nlines-1), end='',flush=True)
-
-
 ## Main
 if __name__ == '__main__':
   parser = argparse.ArgumentParser()